@@ -78,8 +78,9 @@ class DemoData():
 
     def get_adjacency_matrix(self, sparse_matrix):
         pdists = pairwise_distances(sparse_matrix, metric='cityblock')            
-        dists = squareform(pdists)   
-        return dists
+        # condensed, contiguous float64 is what linkage() works on, so it can use it without copying
+        dists = squareform(pdists, checks=False)   
+        return np.ascontiguousarray(dists, dtype=np.float64)
 
     
 
@@ -10,6 +10,11 @@ st.set_page_config(layout="wide")
 from demo_func import DemoData
 import numpy as np
 import scipy.cluster.hierarchy as sch
+try:
+    # drop-in replacement producing the same linkage matrix, but considerably faster
+    from fastcluster import linkage as _linkage
+except ImportError:
+    from scipy.cluster.hierarchy import linkage as _linkage
 import idendro 
 import importlib as imp
 
@@ -18,40 +23,70 @@ signals_to_generate = 100
 network_cluster_count = 12
 x_plot_labels = np.linspace(1, 1000, 1000)
 
-demo = DemoData(no_signals=signals_to_generate, seed=833142, no_network_clusters = network_cluster_count)
-signals = demo.generate_raw_data()
 
-impairments = {
-            "Suckout" : (20, "green", np.arange(300,370), 0.5 * (np.abs(np.arange(-35, 35)) - 35)),
-            "Wave" : (12, "orange", np.arange(580,700), 3*np.sin(np.arange(120)/5)),
-        }
+@st.cache_data
+def generate_clustering():
+    """Generates the demo signals and clusters them, once per session."""
+    demo = DemoData(no_signals=signals_to_generate, seed=833142, no_network_clusters = network_cluster_count)
+    signals = demo.generate_raw_data()
+
+    impairments = {
+                "Suckout" : (20, "green", np.arange(300,370), 0.5 * (np.abs(np.arange(-35, 35)) - 35)),
+                "Wave" : (12, "orange", np.arange(580,700), 3*np.sin(np.arange(120)/5)),
+            }
 
-tilt_x = np.arange(1000)
-tilt_y = np.zeros(1000,)
-tilt_y[demo.ideal_signal > 0] = -tilt_x[demo.ideal_signal > 0] * 0.02
-impairments["Tilt"] = (19, "red", tilt_x, tilt_y)
+    tilt_x = np.arange(1000)
+    tilt_y = np.zeros(1000,)
+    tilt_y[demo.ideal_signal > 0] = -tilt_x[demo.ideal_signal > 0] * 0.02
+    impairments["Tilt"] = (19, "red", tilt_x, tilt_y)
 
-graph, impaired_signals, network_clusters = demo.generate_impaired_graph(impairments=impairments)
-sparse_matrix = demo.get_sparse_wavelet_matrix(impaired_signals)
-dists = demo.get_adjacency_matrix(sparse_matrix)
-model = sch.linkage(dists, method='average')
-threshold = 70
-cluster_assignments = sch.fcluster(model, threshold, criterion='distance')
+    graph, impaired_signals, network_clusters = demo.generate_impaired_graph(impairments=impairments)
+    sparse_matrix = demo.get_sparse_wavelet_matrix(impaired_signals)
+    dists = demo.get_adjacency_matrix(sparse_matrix)
+    model = _linkage(dists, method='average')
+    threshold = 70
+    cluster_assignments = sch.fcluster(model, threshold, criterion='distance')
+    return impaired_signals, model, cluster_assignments, threshold
 
-idd = idendro.Idendro(model, cluster_assignments, threshold)
-idd.dendrogram_kwargs.update({'leaf_label_func': idd.show_only_cluster_labels()})
 
-def hovertext_func(point):
+@st.cache_resource(hash_funcs={np.ndarray: lambda a: a.tobytes()})
+def build_dendrogram(impaired_signals, model, cluster_assignments, threshold):
+    """Builds the dendrogram once per clustering.
+    Streamlit reruns the whole script on every widget interaction, so caching the Idendro
+    instance (and the hover function) lets it reuse its cached payload across reruns."""
+    idd = idendro.Idendro(model, cluster_assignments, threshold)
+    idd.dendrogram_kwargs.update({'leaf_label_func': idd.show_only_cluster_labels()})
+
+    # summarise every node once, bottom-up: children are merged with the pairwise variance update
+    # (count, mean, sum of squared deviations), so no subtree is traversed or re-read on hover
     _, tree = idd.get_tree()
+    node_summaries = {}
+    partial_stats = {}
+    for node in tree:  # ordered by id, so children always come before their parent
+        if node.is_leaf():
+            count, mean, m2 = 1, impaired_signals[node.id], np.zeros(impaired_signals.shape[1])
+        else:
+            count_l, mean_l, m2_l = partial_stats.pop(node.left.id)
+            count_r, mean_r, m2_r = partial_stats.pop(node.right.id)
+            count = count_l + count_r
+            delta = mean_r - mean_l
+            mean = mean_l + delta * count_r / count
+            m2 = m2_l + m2_r + delta**2 * count_l * count_r / count
+        partial_stats[node.id] = (count, mean, m2)
+        node_summaries[node.id] = (count, np.sqrt(m2 / count).max().round(2))
+
+    def hovertext_func(point):
+        count, max_sd = node_summaries[point['id']]
+        return {
+            "Number of items": count,
+            "Type": point['type'],
+            "Max st dev observed": max_sd
+        }
+
+    return idd, hovertext_func
+
 
-    count = tree[point['id']].get_count()
-    nodes = tree[point['id']].pre_order(lambda x: x.get_id() if x.is_leaf() else None)  
-    sds = impaired_signals[nodes, :].std(axis=0)       
-    return {
-        "Number of items": count,
-        "Type": point['type'],
-        "Max st dev observed": sds.max().round(2)
-    }
+idd, hovertext_func = build_dendrogram(*generate_clustering())
 
 orientation = st.selectbox('orientation', ['top', 'bottom', 'right', 'left'], index=0)
 component_value = idd.to_streamlit(key='o', width=1000, height=1000, orientation=orientation, scale_type='log', node_hover_func=hovertext_func)
@@ -3,7 +3,18 @@ import collections
 import altair as alt
 import numpy as np
 import pandas as pd
-from matplotlib.colors import to_hex
+
+_OrientationLayout = collections.namedtuple(
+    "_OrientationLayout", ["label_axis", "value_axis", "label_pos", "reversed_axis"]
+)
+
+# axis encodings, label placement and axis direction for each dendrogram orientation
+_ORIENTATIONS = {
+    "top": _OrientationLayout(alt.X, alt.Y, "bottom", False),
+    "bottom": _OrientationLayout(alt.X, alt.Y, "top", True),
+    "left": _OrientationLayout(alt.Y, alt.X, "right", True),
+    "right": _OrientationLayout(alt.Y, alt.X, "left", False),
+}
 
 
 class AltairFeatures:
@@ -25,21 +36,22 @@ class AltairFeatures:
 
         """
         # instantiate a dendrogram if one is not set yet
-        if self.icoord is None:
-            self.set_default_dendrogram()
+        self.initialize()
 
-        if orientation in ["top", "bottom"]:
-            label_axis = alt.X
-            value_axis = alt.Y
-        else:
-            label_axis = alt.Y
-            value_axis = alt.X
-
-        expr = []
-        for pos, label in zip(
-            self.get_ordered_leaf_positions(), self.ordered_leaf_labels
-        ):
-            expr.append(f"datum.value == {pos} ? '{label}'")
+        if orientation not in _ORIENTATIONS:
+            raise ValueError(
+                f"orientation must be one of {list(_ORIENTATIONS)}, got '{orientation}'"
+            )
+        layout = _ORIENTATIONS[orientation]
+
+        # native lists, so that the loop below does not box numpy scalars
+        leaf_positions = self.get_ordered_leaf_positions().tolist()
+        leaf_labels = self.ordered_leaf_labels.tolist()
+
+        expr = [
+            f"datum.value == {pos} ? '{label}'"
+            for pos, label in zip(leaf_positions, leaf_labels)
+        ]
         expr.append("''")  # else condition
         label_expr_conditions = " : ".join(expr)
 
@@ -48,36 +60,27 @@ class AltairFeatures:
             ycoords=self.dcoord,
         )
 
-        label_pos = {
-            "top": "bottom",
-            "bottom": "top",
-            "left": "right",
-            "right": "left",
-        }[orientation]
-
-        X = label_axis(
+        X = layout.label_axis(
             "x",
             title=None,
             axis=alt.Axis(
                 ticks=False,
                 labelExpr=label_expr_conditions,
-                values=self.get_ordered_leaf_positions(),
-                orient=label_pos,
+                values=leaf_positions,
+                orient=layout.label_pos,
                 grid=False,
                 labelPadding=10,
             ),
         )
-        reversed_axis = orientation in ["bottom", "left"]
-
-        Y = value_axis(
+        Y = layout.value_axis(
             "y",
             title=None,
-            scale=alt.Scale(reverse=reversed_axis),
+            scale=alt.Scale(reverse=layout.reversed_axis),
             axis=alt.Axis(grid=False),
         )
 
         color_domain = np.arange(len(self.link_colors))
-        color_range = [to_hex(c) for c in self.link_colors]
+        color_range = self.link_hex_colors.tolist()
 
         lines = (
             alt.Chart(traces)
@@ -128,28 +131,31 @@ class AltairFeatures:
         """
         Forms the traces representing the links in a dendrogram.
         """
-        trace_list = []
-
-        for i, (xs, ys) in enumerate(zip(xcoords, ycoords)):
-            line_segments = zip(xs, ys, [i] * 4, [1, 2, 3, 4])
-            trace_list += line_segments
-
-        trace_df = pd.DataFrame(trace_list, columns=["x", "y", "detail", "order"])
+        link_count = len(xcoords)
+        trace_df = pd.DataFrame(
+            {
+                "x": np.ravel(xcoords),
+                "y": np.ravel(ycoords),
+                "detail": np.repeat(np.arange(link_count), 4),
+                "order": np.tile([1, 2, 3, 4], link_count),
+            }
+        )
         return trace_df
 
     def get_point_df(self, point_label_func, point_hover_func):
 
         point_traces = []
 
-        points = self.get_points()
+        points = self.get_point_records()
         if point_label_func == "cluster_labels":
             point_label_func = (
                 lambda x: "" if x["type"] != "cluster" else f"{x['cluster_id']}"
             )
 
-        for (x, y), point in points.items():
+        for point in points:
+            x, y = point["x"], point["y"]
             fillcolor = (
-                "white" if point["type"] in ["leaf", "subcluster"] else point["color"]
+                "#ffffff" if point["type"] in ["leaf", "subcluster"] else point["color"]
             )
             edgecolor = point["color"]
             text = point_label_func(point) if point_label_func is not None else ""
@@ -157,8 +163,8 @@ class AltairFeatures:
             p = dict(
                 x=x,
                 y=y,
-                fillcolor=to_hex(fillcolor),
-                edgecolor=to_hex(edgecolor),
+                fillcolor=fillcolor,
+                edgecolor=edgecolor,
                 text=text,
             )
 
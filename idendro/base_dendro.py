@@ -1,11 +1,20 @@
 import scipy.cluster.hierarchy as sch
 import numpy as np
 import json
+import sys
+import functools
+import collections
 from typing import Type, List, Union
-from dataclasses import dataclass, is_dataclass, asdict
+from dataclasses import dataclass, is_dataclass, fields
 from matplotlib.colors import to_hex
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional, speeds up to_json()
+    orjson = None
+
+
+@dataclass(slots=True)
 class ClusterNode:
     x: float
     y: float
@@ -17,65 +26,268 @@ class ClusterNode:
     labelsize: float = 10.0
     labelcolor: str = "white"
 
+    def __post_init__(self):
+        # there are only a handful of distinct colors, so share one string per color
+        self.edgecolor = sys.intern(self.edgecolor)
+        self.fillcolor = sys.intern(self.fillcolor)
 
-@dataclass
+
+@dataclass(slots=True)
 class ClusterLink:
     x: List[float]
     y: List[float]
     fillcolor: str
     size: float = 1.0
 
+    def __post_init__(self):
+        self.fillcolor = sys.intern(self.fillcolor)
+
 
-@dataclass
+@dataclass(slots=True)
 class AxisLabel:
     x: float
     label: str
     labelsize: float = 8.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Dendrogram:
     axis_labels: List[AxisLabel]
     links: List[ClusterLink]
     nodes: List[ClusterNode]
 
 
+def to_builtin(obj):
+    "Recursively converts dataclasses and numpy types into JSON-compatible builtins"
+    if is_dataclass(obj):
+        return {f.name: to_builtin(getattr(obj, f.name)) for f in fields(obj)}
+    if isinstance(obj, dict):
+        return {k: to_builtin(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [to_builtin(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.integer):
+        return int(obj)
+    if isinstance(obj, np.floating):
+        return float(obj)
+    return obj
+
+
 class FullJSONEncoder(json.JSONEncoder):
     def default(self, obj):
-        if isinstance(obj, np.integer):
-            return int(obj)
-        if isinstance(obj, np.floating):
-            return float(obj)
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        if is_dataclass(obj):
-                return asdict(obj)
-        return json.JSONEncoder.default(self, obj)
+        builtin = to_builtin(obj)
+        if builtin is obj:
+            return json.JSONEncoder.default(self, obj)
+        return builtin
+
+
+class _BoundedCache(collections.OrderedDict):
+    "Dictionary that only keeps its most recently used entries"
+
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+# entries kept per result cache: Streamlit scripts may pass new callbacks on every rerun
+_CACHE_MAXSIZE = 4
+
+
+def to_hex_colors(colors) -> np.ndarray:
+    "Converts matplotlib colors to interned hex strings, resolving each color only once"
+    distinct_colors, color_index = np.unique(colors, return_inverse=True)
+    distinct_hex_colors = np.array(
+        [sys.intern(to_hex(color)) for color in distinct_colors], dtype=object
+    )
+    return distinct_hex_colors[color_index.ravel()]
+
+
+# keys of a scipy.cluster.hierarchy.dendrogram() result that set_dendrogram() relies on
+_REQUIRED_DENDROGRAM_KEYS = frozenset(
+    ("icoord", "dcoord", "color_list", "ivl", "leaves", "leaves_color_list")
+)
+
+
+# SciPy places the k-th leaf of a dendrogram at x = 5 + 10 * k
+_FIRST_LEAF_X = 5.0
+_LEAF_SPACING = 10.0
+
+
+class _Identity:
+    "Hashable stand-in comparing an object by identity; holding it keeps its id unique"
+
+    __slots__ = ("obj",)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+    def __hash__(self):
+        return id(self.obj)
+
+
+def _get_key_value(value):
+    "Converts a dendrogram argument to a hashable value that follows its contents"
+    if isinstance(value, np.ndarray):
+        if value.dtype == object:
+            return _get_key_value(value.tolist())
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(_get_key_value(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _get_key_value(v)) for k, v in value.items())
+    try:
+        hash(value)
+    except TypeError:
+        # anything else that is unhashable can only be compared by identity
+        return _Identity(value)
+    return value
+
+
+def _get_dendrogram_key(dendrogram_kwargs: dict) -> tuple:
+    "Builds a hashable key from scipy.cluster.hierarchy.dendrogram() arguments"
+    return tuple(
+        (name, _get_key_value(value))
+        for name, value in sorted(dendrogram_kwargs.items())
+    )
+
+
+def _assemble_internal_nodes(
+    left_leaf, right_leaf, left_x, right_x, merged_x, leaf_ids, parent_of
+):
+    """Resolves the node id of every link of a SciPy dendrogram, along with the index
+    of the first link in its subtree. left_leaf/right_leaf hold the position of the
+    leaf a child may be (it is at height zero), or -1 for children that are merges"""
+    link_count = len(left_leaf)
+    merged_ids = np.empty(link_count, dtype=np.int64)
+    subtree_start = np.empty(link_count, dtype=np.int64)
+
+    # SciPy lists links in post-order (left subtree, right subtree, then the merge),
+    # so the merged children of a link are always the most recent unclaimed merges,
+    # and the links below a link form a contiguous run ending right before it
+    pending = np.empty(link_count, dtype=np.int64)
+    pending_count = 0
+    half_spacing = _LEAF_SPACING / 2
+
+    for i in range(link_count):
+        # merges of duplicate observations sit at height zero as well; such a child is
+        # the latest pending merge, which is centred on it, while any earlier subtree
+        # lies at least one leaf spacing to the left
+        start = i
+        if right_leaf[i] < 0 or (
+            pending_count > 0
+            and abs(merged_x[pending[pending_count - 1]] - right_x[i]) < half_spacing
+        ):
+            pending_count -= 1
+            start = subtree_start[pending[pending_count]]
+        if left_leaf[i] < 0 or (
+            pending_count > 0
+            and abs(merged_x[pending[pending_count - 1]] - left_x[i]) < half_spacing
+        ):
+            pending_count -= 1
+            left = pending[pending_count]
+            start = subtree_start[left]
+            left_id = merged_ids[left]
+        else:
+            left_id = leaf_ids[left_leaf[i]]
+
+        # the left child alone identifies the merge
+        merged_ids[i] = parent_of[left_id]
+        subtree_start[i] = start
+        pending[pending_count] = i
+        pending_count += 1
+
+    if link_count > 0 and pending_count != 1:
+        raise ValueError("dendrogram links do not form a single tree")
+
+    return merged_ids, subtree_start
+
+
+# loading the compiled loop takes a fraction of a second: it only pays off on big trees
+_JIT_MIN_LINKS = 500_000
+
+
+@functools.lru_cache(maxsize=None)
+def _get_compiled_assembler():
+    "Compiles the node assembly loop with numba on first use; None if numba is missing"
+    try:
+        from numba import njit
+    except ImportError:  # optional, compiles the node assembly loop
+        return None
+    return njit(cache=True)(_assemble_internal_nodes)
+
+
+# linkage matrices with fewer merges get their cluster leaders computed on construction
+_EAGER_LEADERS_MAX_MERGES = 1_000_000
+
+
+@functools.lru_cache(maxsize=8)
+def _build_tree(linkage_bytes: bytes):
+    "Builds the SciPy tree of a linkage matrix, given its raw float64 bytes"
+    linkage_matrix = np.frombuffer(linkage_bytes, dtype=np.float64).reshape(-1, 4)
+    return sch.to_tree(linkage_matrix, rd=True)
 
 
 class BaseDendro:
     def __init__(
-        self, linkage_matrix, cluster_assignments, threshold, dendrogram_kwargs={}
+        self, linkage_matrix, cluster_assignments, threshold, dendrogram_kwargs=None
     ) -> None:
         self.linkage_matrix = linkage_matrix
         self.cluster_assignments = cluster_assignments
         self.threshold = threshold
-        self.dendrogram_kwargs = dendrogram_kwargs
+        # a fresh dict per instance: callers update it in place (e.g. leaf_label_func)
+        self.dendrogram_kwargs = (
+            dendrogram_kwargs if dendrogram_kwargs is not None else {}
+        )
 
         self.icoord = None
         self.dcoord = None
         self.link_colors = None
+        self.link_hex_colors = None
         self.ordered_leaf_labels = None
         self.leaves = None
         self.leaves_color_list = None
+        self.leaf_hex_colors = None
+        self.leaf_positions = None
+        # arguments the current dendrogram was built with; None if the caller set it
+        self._dendrogram_key = None
 
         self.leaders = None
         self.flat_cluster_ids = None
+        self._leader_mask = None
+        # nearly every converter needs the leaders, so compute them upfront if cheap
+        if self.linkage_matrix.shape[0] < _EAGER_LEADERS_MAX_MERGES:
+            self.get_leaders()
 
         self.rootnode = None
         self.nodelist = None
+        self._children = None
 
         self.points = None
+        self._point_records = None
+        self._point_arrays = None
+
+        # column-wise (struct-of-arrays) view of the links, see get_link_arrays()
+        self._link_arrays = None
+        self._coordinate_limits = None
+        # node lists, Dendrogram objects and their builtin forms, keyed by arguments
+        self._node_cache = _BoundedCache(_CACHE_MAXSIZE)
+        self._data_cache = _BoundedCache(_CACHE_MAXSIZE)
+        self._dict_cache = _BoundedCache(_CACHE_MAXSIZE)
 
     def get_leaders(self):
         if self.leaders is None:
@@ -84,15 +296,45 @@ class BaseDendro:
             )
             self.leaders = leaders
             self.flat_cluster_ids = clusters
+            # one flag per node id, so many nodes can be checked for leaders at once
+            self._leader_mask = np.zeros(
+                2 * len(self.cluster_assignments) - 1, dtype=bool
+            )
+            self._leader_mask[leaders] = True
         return self.leaders, self.flat_cluster_ids
 
     def get_tree(self):
         if self.rootnode is None:
-            rootnode, nodelist = sch.to_tree(self.linkage_matrix, rd=True)
+            # cached by content: instances with the same linkage matrix share one tree
+            linkage_bytes = np.ascontiguousarray(
+                self.linkage_matrix, dtype=np.float64
+            ).tobytes()
+            rootnode, nodelist = _build_tree(linkage_bytes)
             self.rootnode = rootnode
             self.nodelist = nodelist
         return self.rootnode, self.nodelist
 
+    def get_leaves_under(self, node_id) -> np.ndarray:
+        """Returns the ids of the original observations under a node, left to right.
+        Walks the linkage matrix with an explicit stack instead of recursing"""
+        n = self.linkage_matrix.shape[0] + 1
+        if self._children is None:
+            self._children = self.linkage_matrix[:, :2].astype(np.int64).tolist()
+
+        children = self._children
+        stack = [int(node_id)]
+        leaves = []
+        while stack:
+            i = stack.pop()
+            if i < n:
+                leaves.append(i)
+            else:
+                left, right = children[i - n]
+                # push right first, so that the left subtree is visited first
+                stack.append(right)
+                stack.append(left)
+        return np.asarray(leaves, dtype=np.int64)
+
     def get_counts(self) -> callable:
         _, nodelist = self.get_tree()
 
@@ -105,17 +347,16 @@ class BaseDendro:
         self, fmt_string="Cluster {cluster} ({cluster_size} data points)"
     ) -> callable:
         leaders, clusters = self.get_leaders()
-        _, nodelist = self.get_tree()
         cluster_list = {}
         # for each leader ("cluster"), find the associated data points
         for l, c in zip(leaders, clusters):
-            cluster_list[c] = nodelist[l].pre_order(lambda x: x.id)
+            cluster_list[c] = set(self.get_leaves_under(l).tolist())
 
         seen_clusters = []
 
         def labeller(id):
             # grab first real leaf node of the passed id
-            leaf_nodes = nodelist[id].pre_order(lambda x: x.id if x.is_leaf() else None)
+            leaf_nodes = self.get_leaves_under(id)
             lf_node = leaf_nodes[0]
             # traverse all leader nodes, checking if they have the leaf node
             for c, nodes in cluster_list.items():
@@ -135,14 +376,37 @@ class BaseDendro:
         return labeller
 
     def set_dendrogram(self, dendrogram):
-        self.icoord = np.array(dendrogram["icoord"])
-        self.dcoord = np.array(dendrogram["dcoord"])
+        missing_keys = _REQUIRED_DENDROGRAM_KEYS.difference(dendrogram)
+        if missing_keys:
+            missing = ", ".join(sorted(missing_keys))
+            raise ValueError(f"dendrogram is missing required keys: {missing}")
+
+        # coordinates are plotting data, so single precision is plenty
+        self.icoord = np.asarray(dendrogram["icoord"], dtype=np.float32)
+        self.dcoord = np.asarray(dendrogram["dcoord"], dtype=np.float32)
         self.link_colors = np.array(dendrogram["color_list"])
+        # resolve the colors to hex once, rather than in every converter call
+        self.link_hex_colors = to_hex_colors(self.link_colors)
         self.ordered_leaf_labels = np.array(dendrogram["ivl"])
         self.leaves = np.array(dendrogram["leaves"])
         self.leaves_color_list = np.array(dendrogram["leaves_color_list"])
+        self.leaf_hex_colors = to_hex_colors(self.leaves_color_list)
+        self.leaf_positions = None
+        self._dendrogram_key = None
+        self.points = None
+        self._point_records = None
+        self._point_arrays = None
+        self._link_arrays = None
+        self._coordinate_limits = None
+        self._node_cache.clear()
+        self._data_cache.clear()
+        self._dict_cache.clear()
 
     def set_default_dendrogram(self):
+        """Builds the dendrogram from the defaults updated with dendrogram_kwargs,
+        unless the current one was built from equal arguments. Lists, tuples, dicts
+        and arrays are compared by content; other unhashable values only by identity,
+        so changing such an object in place does not trigger a rebuild"""
         default_kwargs = {
             "truncate_mode": "level",
             "p": 4,
@@ -150,140 +414,300 @@ class BaseDendro:
             "leaf_label_func": None,
         }
         default_kwargs.update(self.dendrogram_kwargs)
+
+        # rebuilding is only needed if the arguments changed since the last build
+        key = _get_dendrogram_key(default_kwargs)
+        if self.icoord is not None and key == self._dendrogram_key:
+            return
+
         dd = sch.dendrogram(Z=self.linkage_matrix, no_plot=True, **default_kwargs)
         self.set_dendrogram(dd)
+        self._dendrogram_key = key
+
+    def get_parent_map(self) -> np.ndarray:
+        """Maps each node id to the id of the node it is merged into (-1 for the root).
+        Every node is merged exactly once, so either child identifies a merge"""
+        n = self.linkage_matrix.shape[0]
+        parents = np.full(2 * n + 1, -1, dtype=np.int64)
+        merged_ids = np.arange(n + 1, 2 * n + 1, dtype=np.int64)
+        parents[self.linkage_matrix[:, 0].astype(np.int64)] = merged_ids
+        parents[self.linkage_matrix[:, 1].astype(np.int64)] = merged_ids
+        return parents
+
+    def get_point_arrays(self) -> dict:
+        """Returns the dendrogram nodes (leaves first, then merges in link order) as
+        parallel arrays of coordinates, ids, colors, types and flat cluster ids.
+        Column-wise consumers should prefer this over get_point_records()"""
+
+        # instantiate a dendrogram if one is not set yet, or rebuild an outdated one
+        self.initialize()
 
-    def get_points(self):
-
-        if self.points is None:
+        if self._point_arrays is None:
 
-            # instantiate a dendrogram if one is not set yet
-            if self.icoord is None:
-                self.set_default_dendrogram()
+            leaders, flat_cluster_ids = self.get_leaders()
+            # flat cluster id of every node id; None for nodes not leading a cluster
+            cluster_of_node = np.full(len(self._leader_mask), None, dtype=object)
+            cluster_of_node[leaders] = flat_cluster_ids.tolist()
 
-            component_ids = zip(
-                self.linkage_matrix[:, 0].astype(int),
-                self.linkage_matrix[:, 1].astype(int),
+            xpos = self.get_ordered_leaf_positions()
+            leaf_ids = self.leaves.astype(np.int64)
+            leaf_count = len(leaf_ids)
+            link_count = len(self.icoord)
+
+            # children at height zero are leaves or merges of duplicate observations,
+            # which the assembly loop tells apart; look up the leaf each would be
+            left_x = self.icoord[:, 0].astype(np.float64)
+            right_x = self.icoord[:, 3].astype(np.float64)
+            left_leaf = np.where(
+                self.dcoord[:, 0] == 0, self._get_leaf_index(left_x), -1
+            )
+            right_leaf = np.where(
+                self.dcoord[:, 3] == 0, self._get_leaf_index(right_x), -1
             )
-            merged_ids = np.arange(
-                self.linkage_matrix.shape[0] + 1,
-                (self.linkage_matrix.shape[0] + 1) * 2 - 1,
+            # merge points are averaged in double precision
+            merged_x = self.icoord[:, 1:3].mean(axis=1, dtype=np.float64)
+
+            assemble = _assemble_internal_nodes
+            if link_count >= _JIT_MIN_LINKS:
+                assemble = _get_compiled_assembler() or _assemble_internal_nodes
+            merged_ids, subtree_start = assemble(
+                left_leaf,
+                right_leaf,
+                left_x,
+                right_x,
+                merged_x,
+                leaf_ids,
+                self.get_parent_map(),
             )
-            id_dict = dict(zip(component_ids, merged_ids))
 
-            leaders, flat_cluster_ids = self.get_leaders()
+            merged_y = self.dcoord[:, 2]
 
-            xpos = self.get_ordered_leaf_positions()
-            ypos = np.zeros(xpos.shape)
-
-            point_dict = {}
-            for coords, leaf_id, color in zip(
-                zip(xpos, ypos), self.leaves, self.leaves_color_list
-            ):
-                point_dict[coords] = {
-                    "id": leaf_id,
-                    "color": color,
-                    "type": "leaf",
-                    "cluster_id": None,
-                }
+            is_cluster = self._leader_mask[merged_ids]
+
+            # a merge is a subcluster if no cluster lies below it, else a supercluster
+            clusters_before = np.concatenate([[0], np.cumsum(is_cluster)])
+            has_cluster_below = (
+                clusters_before[:link_count] > clusters_before[subtree_start]
+            )
+            link_types = np.where(
+                is_cluster,
+                "cluster",
+                np.where(has_cluster_below, "supercluster", "subcluster"),
+            )
 
-            for x, y, color in zip(self.icoord, self.dcoord, self.link_colors):
-                left_coords = (x[0], y[0])
-                right_coords = (x[3], y[3])
-                right_leaf = point_dict[right_coords]
-                left_leaf = point_dict[left_coords]
-                merged_id = id_dict[(left_leaf["id"], right_leaf["id"])]
-
-                cluster_id = None
-                if merged_id in leaders:
-                    type = "cluster"
-                    cluster_id = flat_cluster_ids[leaders == merged_id][0]
-                elif right_leaf["type"] in ["leaf", "subcluster"] and left_leaf[
-                    "type"
-                ] in ["leaf", "subcluster"]:
-                    type = "subcluster"
-                else:
-                    type = "supercluster"
-
-                merged_coords = (x[1] + (x[2] - x[1]) / 2.0, y[2])
-                point_dict[merged_coords] = {
-                    "id": merged_id,
+            self._point_arrays = {
+                "x": np.concatenate([xpos, merged_x]),
+                "y": np.concatenate([np.zeros(leaf_count, dtype=np.float32), merged_y]),
+                "id": np.concatenate([leaf_ids, merged_ids]),
+                "color": np.concatenate([self.leaf_hex_colors, self.link_hex_colors]),
+                "type": np.concatenate(
+                    [
+                        np.full(leaf_count, "leaf", dtype=object),
+                        link_types.astype(object),
+                    ]
+                ),
+                "cluster_id": np.concatenate(
+                    [
+                        np.full(leaf_count, None, dtype=object),
+                        cluster_of_node[merged_ids],
+                    ]
+                ),
+            }
+
+        return self._point_arrays
+
+    def get_point_records(self) -> List[dict]:
+        """Returns one record per dendrogram node (leaves first, then merges in link
+        order), holding its coordinates, id, color, type and flat cluster id"""
+
+        # fetched first: rebuilding an outdated dendrogram also drops stale records
+        arrays = self.get_point_arrays()
+
+        if self._point_records is None:
+            # records are only materialised here, for consumers that need callbacks
+            columns = [column.tolist() for column in arrays.values()]
+            self._point_records = [
+                dict(zip(arrays.keys(), values)) for values in zip(*columns)
+            ]
+
+        return self._point_records
+
+    def get_points(self) -> dict:
+        """Returns the dendrogram nodes keyed by their (x, y) coordinates, each holding
+        its id, color (as given by SciPy), type and flat cluster id.
+        Kept for backwards compatibility; get_point_records() and get_point_arrays()
+        are faster"""
+
+        arrays = self.get_point_arrays()
+
+        if self.points is None:
+            colors = np.concatenate([self.leaves_color_list, self.link_colors]).tolist()
+            self.points = {
+                (x, y): {
+                    "id": id,
                     "color": color,
                     "type": type,
                     "cluster_id": cluster_id,
                 }
-
-            self.points = point_dict
+                for x, y, id, color, type, cluster_id in zip(
+                    arrays["x"].tolist(),
+                    arrays["y"].tolist(),
+                    arrays["id"].tolist(),
+                    colors,
+                    arrays["type"].tolist(),
+                    arrays["cluster_id"].tolist(),
+                )
+            }
 
         return self.points
 
     def get_ordered_leaf_positions(self) -> np.ndarray:
         "Finds the X-coordinate of the leafs in a dendrogram (Y-coordinate is zero)"
-        X = self.icoord.flatten()
-        Y = self.dcoord.flatten()
-        return np.sort(X[Y == 0.0])
+        if self.leaf_positions is None:
+            # derived from the leaf count, as duplicate observations merge at zero too
+            leaf_positions = np.arange(len(self.leaves), dtype=np.float32)
+            leaf_positions *= np.float32(_LEAF_SPACING)
+            leaf_positions += np.float32(_FIRST_LEAF_X)
+            self.leaf_positions = leaf_positions
+        return self.leaf_positions
+
+    @staticmethod
+    def _get_leaf_index(x: np.ndarray) -> np.ndarray:
+        "Returns the position of the leaf nearest to each X-coordinate"
+        return np.rint((x - _FIRST_LEAF_X) / _LEAF_SPACING).astype(np.int64)
+
+    def get_link_arrays(self) -> dict:
+        """Returns the links as parallel arrays, one per ClusterLink field.
+        Column-wise consumers should prefer this over get_cluster_links()"""
+        if self._link_arrays is None:
+            self._link_arrays = {
+                "x": self.icoord,
+                "y": self.dcoord,
+                "fillcolor": self.link_hex_colors,
+                "size": np.ones(len(self.icoord), dtype=np.float32),
+            }
+        return self._link_arrays
+
+    def get_coordinate_limits(self):
+        "Returns the (min, max) extent of the links along the leaf and distance axes"
+        if self._coordinate_limits is None:
+            # each link spans from its left end (column 0) to its right end (column 3),
+            # and nothing lies above its merge height (column 1): only those are read
+            x_limits = (float(self.icoord[:, 0].min()), float(self.icoord[:, 3].max()))
+            y_limits = (
+                float(min(self.dcoord[:, 0].min(), self.dcoord[:, 3].min())),
+                float(self.dcoord[:, 1].max()),
+            )
+            self._coordinate_limits = (x_limits, y_limits)
+        return self._coordinate_limits
 
     def get_cluster_links(self) -> List[ClusterLink]:
+        arrays = self.get_link_arrays()
+        # tolist() converts each column in one pass, yielding the declared List[float]
         return [
-            ClusterLink(x=x, y=y, fillcolor=to_hex(color))
-            for x, y, color in zip(self.icoord, self.dcoord, self.link_colors)
+            ClusterLink(x=x, y=y, fillcolor=color, size=size)
+            for x, y, color, size in zip(
+                *(column.tolist() for column in arrays.values())
+            )
         ]
 
+    def get_link_records(self) -> List[dict]:
+        "Returns the links as JSON-compatible dicts, converting each column at once"
+        arrays = self.get_link_arrays()
+        columns = [column.tolist() for column in arrays.values()]
+        return [dict(zip(arrays.keys(), values)) for values in zip(*columns)]
+
     def get_axis_labels(self) -> List[AxisLabel]:
+        positions = self.get_ordered_leaf_positions().tolist()
         return [
-            AxisLabel(label =  l, x = x)
-            for x, l in zip(self.get_ordered_leaf_positions(), self.ordered_leaf_labels)
-        ]    
+            AxisLabel(label=l, x=x)
+            for x, l in zip(positions, self.ordered_leaf_labels.tolist())
+        ]
 
     def initialize(self):
-        if self.icoord is None:
+        """Builds the default dendrogram, unless an up-to-date or caller-provided one
+        is set. See set_default_dendrogram() for how kwargs changes are detected"""
+        if self.icoord is None or self._dendrogram_key is not None:
             self.set_default_dendrogram()
 
-
     def to_data(
         self,
         show_nodes=False,
         node_label_func="cluster_labels",
         node_hover_func=None,
     ) -> Dendrogram:
+        """Returns the dendrogram as a Dendrogram object.
+        The results for the most recent sets of arguments are cached until a new
+        dendrogram is set. Each call returns fresh lists, but the links, labels and
+        nodes in them are shared, so callers must not modify those in place."""
 
         self.initialize()
 
-        links = self.get_cluster_links()
-        axis_labels = self.get_axis_labels()
-        nodes = []
-        
-        if show_nodes:
-            nodes = self.get_cluster_nodes(
-                node_label_func=node_label_func, node_hover_func=node_hover_func
+        # the callbacks themselves (not their ids) are keyed, so a recycled id can't hit
+        key = (show_nodes, node_label_func, node_hover_func)
+        if key not in self._data_cache:
+            links = self.get_cluster_links()
+            axis_labels = self.get_axis_labels()
+            nodes = []
+
+            if show_nodes:
+                nodes = self.get_cluster_nodes(
+                    node_label_func=node_label_func, node_hover_func=node_hover_func
+                )
+
+            self._data_cache[key] = Dendrogram(
+                links=links, axis_labels=axis_labels, nodes=nodes
             )
-            
-        return Dendrogram(links = links, axis_labels = axis_labels, nodes = nodes)
+
+        data = self._data_cache[key]
+        return Dendrogram(
+            links=list(data.links),
+            axis_labels=list(data.axis_labels),
+            nodes=list(data.nodes),
+        )
 
     def get_cluster_nodes(self, node_label_func, node_hover_func) -> List[ClusterNode]:
+        # to_data() and to_dict() both need the nodes, so build them once; callers get
+        # their own list, but the ClusterNode objects in it are shared
+        key = (node_label_func, node_hover_func)
+        if key in self._node_cache:
+            return list(self._node_cache[key])
+
         node_list = []
 
-        points = self.get_points()
+        points = self.get_point_records()
         if node_label_func == "cluster_labels":
-            node_label_func = (
-                lambda x: "" if x["type"] != "cluster" else x["cluster_id"]
+            node_label_func = lambda x: (
+                "" if x["type"] != "cluster" else x["cluster_id"]
             )
 
-        for (x, y), point in points.items():
+        # decide once whether callbacks are needed, rather than checking for every node
+        if node_label_func is not None:
+            labels = [node_label_func(point) for point in points]
+        else:
+            labels = [""] * len(points)
+
+        if node_hover_func is not None:
+            hovertexts = [node_hover_func(point) for point in points]
+        else:
+            hovertexts = [""] * len(points)
+
+        for point, label, hovertext in zip(points, labels, hovertexts):
+            x, y = point["x"], point["y"]
             fillcolor = (
-                "#fff" if (point["type"] in ["leaf", "subcluster"]) and (y != 0) else point["color"]
+                "#ffffff"
+                if (point["type"] in ["leaf", "subcluster"]) and (y != 0)
+                else point["color"]
             )
             edgecolor = point["color"]
 
             p = ClusterNode(
                 x=x,
                 y=y,
-                edgecolor=to_hex(edgecolor),
-                fillcolor=to_hex(fillcolor),
-                label=node_label_func(point) if node_label_func is not None else "",
-                hovertext=node_hover_func(point)
-                if node_hover_func is not None
-                else "",                
+                edgecolor=edgecolor,
+                fillcolor=fillcolor,
+                label=label,
+                hovertext=hovertext,
             )
 
             if y == 0:
@@ -291,7 +715,35 @@ class BaseDendro:
 
             node_list.append(p)
 
-        return node_list
+        self._node_cache[key] = node_list
+        return list(node_list)
+
+    def to_dict(
+        self,
+        show_nodes=False,
+        node_label_func="cluster_labels",
+        node_hover_func=None,
+    ) -> dict:
+        """Returns the dendrogram as a dictionary of JSON-compatible builtins.
+        The results for the most recent sets of arguments are cached until a new
+        dendrogram is set, so callers must not modify them in place."""
+
+        self.initialize()
+
+        key = (show_nodes, node_label_func, node_hover_func)
+        if key not in self._dict_cache:
+            nodes = []
+            if show_nodes:
+                nodes = self.get_cluster_nodes(
+                    node_label_func=node_label_func, node_hover_func=node_hover_func
+                )
+
+            self._dict_cache[key] = {
+                "axis_labels": to_builtin(self.get_axis_labels()),
+                "links": self.get_link_records(),
+                "nodes": to_builtin(nodes),
+            }
+        return self._dict_cache[key]
 
     def to_json(
         self,
@@ -299,11 +751,18 @@ class BaseDendro:
         node_label_func="cluster_labels",
         node_hover_func=None,
     ):
+        """Returns the dendrogram as a JSON string, serialized with orjson if installed.
+        Note that NaN values (e.g. in hovertext) are written as null by orjson, but as
+        NaN by the standard library fallback, which is not strictly valid JSON."""
 
-        dendrogram = self.to_data(
+        dendrogram = self.to_dict(
             show_nodes=show_nodes,
             node_hover_func=node_hover_func,
             node_label_func=node_label_func,
         )
 
-        return json.dumps(dendrogram, cls=FullJSONEncoder)
+        if orjson is not None:
+            # like json.dumps(), write non-string keys (e.g. from hover callbacks)
+            options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            return orjson.dumps(dendrogram, option=options).decode()
+        return json.dumps(dendrogram)
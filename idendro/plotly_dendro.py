@@ -1,7 +1,6 @@
 import collections
 from plotly.graph_objs import graph_objs
 import numpy as np
-from matplotlib.colors import to_hex
 
 
 class PlotlyFeatures:
@@ -26,8 +25,7 @@ class PlotlyFeatures:
 
         """
         # instantiate a dendrogram if one is not set yet
-        if self.icoord is None:
-            self.set_default_dendrogram()
+        self.initialize()
 
         layout = {"xaxis": {}, "yaxis": {}}
 
@@ -111,16 +109,23 @@ class PlotlyFeatures:
     def get_link_traces(self, xcoords: np.ndarray, ycoords: np.ndarray):
         """
         Forms the traces representing the links in a dendrogram.
+        Links sharing a color are batched into a single trace (separated by NaN gaps),
+        so the figure holds one trace per color rather than one per link.
         """
-        trace_list = []
+        # append a NaN gap to each link, so selected rows can be flattened into a line
+        gap = np.full((len(xcoords), 1), np.nan, dtype=xcoords.dtype)
+        xlines = np.hstack([xcoords, gap])
+        ylines = np.hstack([ycoords, gap])
 
-        for xs, ys, color in zip(xcoords, ycoords, self.link_colors):
+        trace_list = []
+        for color in dict.fromkeys(self.link_hex_colors.tolist()):
+            selected = self.link_hex_colors == color
             trace = dict(
                 type="scatter",
-                x=xs,
-                y=ys,
+                x=xlines[selected].ravel(),
+                y=ylines[selected].ravel(),
                 mode="lines",
-                marker=dict(color=to_hex(color)),
+                marker=dict(color=color),
                 text=None,
                 hoverinfo="text",
             )
@@ -142,17 +147,20 @@ class PlotlyFeatures:
         }
         used_point_kwargs.update(point_trace_kwargs)
 
-        points = self.get_points()
+        points = self.get_point_records()
         if point_label_func == "cluster_labels":
             point_label_func = (
                 lambda x: "" if x["type"] != "cluster" else f"<b>{x['cluster_id']}</b>"
             )
 
-        for (x, y), point in points.items():
-            if orientation in ["left", "right"]:
-                x, y = y, x
+        # resolve the orientation once, rather than swapping coordinates inside the loop
+        coords = [(point["x"], point["y"]) for point in points]
+        if orientation in ["left", "right"]:
+            coords = [(y, x) for x, y in coords]
+
+        for (x, y), point in zip(coords, points):
             fillcolor = (
-                "white" if point["type"] in ["leaf", "subcluster"] else point["color"]
+                "#ffffff" if point["type"] in ["leaf", "subcluster"] else point["color"]
             )
             edgecolor = point["color"]
 
@@ -160,9 +168,9 @@ class PlotlyFeatures:
                 x=[x],
                 y=[y],
                 marker=dict(
-                    color=to_hex(fillcolor),
+                    color=fillcolor,
                     size=14,
-                    line=dict(width=2, color=to_hex(edgecolor)),
+                    line=dict(width=2, color=edgecolor),
                 ),
                 text=point_label_func(point) if point_label_func is not None else "",
             )
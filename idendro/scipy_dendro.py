@@ -2,6 +2,15 @@ from scipy.cluster.hierarchy import _plot_dendrogram
 import numpy as np
 import matplotlib.pyplot as plt
 
+# Line2D marker keywords accepted in point_kwargs, and their scatter() counterparts
+_SCATTER_KEYWORDS = {
+    'markersize': 's', 'ms': 's',
+    'markeredgewidth': 'linewidths', 'mew': 'linewidths',
+    'markeredgecolor': 'edgecolors', 'mec': 'edgecolors',
+    'markerfacecolor': 'c', 'mfc': 'c',
+    'marker': 'marker', 'alpha': 'alpha', 'zorder': 'zorder', 'label': 'label',
+}
+
 class SciPyFeatures:
 
     def to_scipy(self, 
@@ -18,8 +27,7 @@ class SciPyFeatures:
     ):
 
         #instantiate a dendrogram if one is not set yet
-        if self.icoord is None:
-            self.set_default_dendrogram()
+        self.initialize()
 
         mh = np.max(self.linkage_matrix[:, 2])
 
@@ -36,20 +44,53 @@ class SciPyFeatures:
             used_point_kwargs = {'markersize': 14}
             used_point_kwargs.update(point_kwargs)
 
-            used_label_kwargs = {'size': 8, 'color': 'white', 'fontweight': 'bold', 'ha': 'center', 'va': 'center'}
+            # labels go above the points (zorder 3) unless the caller says otherwise
+            used_label_kwargs = {
+                'size': 8, 'color': 'white', 'fontweight': 'bold',
+                'ha': 'center', 'va': 'center', 'zorder': 4,
+            }
             used_label_kwargs.update(label_kwargs)
 
             ploton = ax if ax is not None else plt
-            points = self.get_points()
             if point_label_func == 'cluster_labels':
                 point_label_func = lambda x: "" if x['type'] != 'cluster' else x['cluster_id']
 
-            for (x,y), point in points.items():
-                if orientation in ['left', 'right']:
-                    x,y = y,x
-                facecolor = 'white' if point['type'] in ['leaf', 'subcluster'] else point['color']
-                ploton.plot(x, y, marker='o', markerfacecolor=facecolor, markeredgecolor=point['color'], **used_point_kwargs)
+            # points are drawn from the node arrays; records are only used for labels
+            point_arrays = self.get_point_arrays()
+            xs, ys = point_arrays['x'], point_arrays['y']
+            if orientation in ['left', 'right']:
+                xs, ys = ys, xs
+
+            edgecolors = point_arrays['color']
+            facecolors = np.where(
+                np.isin(point_arrays['type'], ['leaf', 'subcluster']),
+                'white',
+                edgecolors,
+            )
+
+            if set(used_point_kwargs).issubset(_SCATTER_KEYWORDS):
+                # draw all points as one collection; scatter sizes are areas
+                scatter_kwargs = {
+                    'marker': 'o', 'zorder': 3,
+                    'c': facecolors, 'edgecolors': edgecolors,
+                }
+                for key, val in used_point_kwargs.items():
+                    scatter_key = _SCATTER_KEYWORDS[key]
+                    if scatter_key == 's':
+                        val = val ** 2
+                    scatter_kwargs[scatter_key] = val
+                ploton.scatter(xs, ys, **scatter_kwargs)
+            else:
+                # other Line2D keywords have no scatter() equivalent: plot points singly
+                for x, y, facecolor, edgecolor in zip(xs, ys, facecolors, edgecolors):
+                    ploton.plot(
+                        x, y, marker='o',
+                        markerfacecolor=facecolor, markeredgecolor=edgecolor,
+                        **used_point_kwargs
+                    )
 
-                if point_label_func is not None:
+            if point_label_func is not None:
+                for x, y, point in zip(xs, ys, self.get_point_records()):
                     label = point_label_func(point)
-                    ploton.text(x, y, s=label, **used_label_kwargs)
+                    if label is not None and label != "":
+                        ploton.text(x, y, s=label, **used_label_kwargs)
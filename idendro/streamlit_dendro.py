@@ -1,7 +1,5 @@
 import os
 import streamlit.components.v1 as components
-import json
-import numpy as np
 
 
 _RELEASE = False
@@ -36,11 +34,18 @@ class StreamlitFeatures:
             frontend.)
 
         """
-        dendrogram = json.loads(self.to_json(show_nodes=True, node_hover_func=node_hover_func, node_label_func=node_label_func))
-        xmin, xmax = np.min(self.icoord), np.max(self.icoord)
+        # shallow copy, so that the cached payload is not modified
+        dendrogram = dict(
+            self.to_dict(
+                show_nodes=True,
+                node_hover_func=node_hover_func,
+                node_label_func=node_label_func,
+            )
+        )
+        (xmin, xmax), y_limits = self.get_coordinate_limits()
 
         dendrogram["x_limits"] = (xmin - (xmax - xmin) * 0.05, xmax + (xmax - xmin) * 0.05)
-        dendrogram["y_limits"] = (np.min(self.dcoord), np.max(self.dcoord))
+        dendrogram["y_limits"] = y_limits
         component_value = _component_func(
             data=dendrogram,
             key=key,